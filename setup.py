@@ -0,0 +1,22 @@
+"""Optional extension build for the Cython-compiled genre parser.
+
+The package is pure Python by default and all metadata lives in
+pyproject.toml. Set ``YTMUSICAPI_BUILD_EXT=1`` (with Cython installed) to
+additionally build ytmusicapi/parsers/_genre_fast.pyx; without it this file
+is a no-op passthrough to setuptools.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("YTMUSICAPI_BUILD_EXT") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["ytmusicapi/parsers/_genre_fast.pyx"],
+        compiler_directives={"language_level": "3", "boundscheck": False},
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,284 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from ytmusicapi.parsers import genre as genre_parser
+
+
+def load_genre_response() -> dict:
+    data_dir = Path(__file__).parent.parent / "data"
+    with open(data_dir / "2026_08_browse_genre.json", encoding="utf8") as f:
+        return json.load(f)
+
+
+def make_song_item(index: int, *, columns: int = 2) -> dict:
+    """Build a musicResponsiveListItemRenderer song row like the fixture's."""
+    flex_columns = [
+        {
+            "musicResponsiveListItemFlexColumnRenderer": {
+                "text": {
+                    "runs": [
+                        {
+                            "text": f"Song Title {index}",
+                            "navigationEndpoint": {"watchEndpoint": {"videoId": f"vid{index:08d}"}},
+                        }
+                    ]
+                }
+            }
+        },
+        {
+            "musicResponsiveListItemFlexColumnRenderer": {
+                "text": {
+                    "runs": [
+                        {
+                            "text": "The Strokes",
+                            "navigationEndpoint": {
+                                "browseEndpoint": {"browseId": "UCkEmjYcVso7RQ_9hYQ1dVNg"}
+                            },
+                        },
+                        {"text": " • "},
+                        {"text": "1.2M views"},
+                    ]
+                }
+            }
+        },
+    ]
+    return {"musicResponsiveListItemRenderer": {"flexColumns": flex_columns[:columns]}}
+
+
+def make_shelf_response(*song_counts: int) -> dict:
+    """Build a genre browse response with one musicShelfRenderer per count."""
+    sections = [
+        {
+            "musicShelfRenderer": {
+                "title": {"runs": [{"text": f"Shelf {shelf_index}"}]},
+                "contents": [make_song_item(i) for i in range(count)],
+            }
+        }
+        for shelf_index, count in enumerate(song_counts)
+    ]
+    return {
+        "contents": {
+            "singleColumnBrowseResultsRenderer": {
+                "tabs": [{"tabRenderer": {"content": {"sectionListRenderer": {"contents": sections}}}}]
+            }
+        }
+    }
+
+
+@pytest.fixture(name="reset_specializer")
+def fixture_reset_specializer():
+    """Pin the song-field parser to its initial counting state around a test."""
+    genre_parser._parse_song_fields = genre_parser._parse_song_fields_counting
+    genre_parser._two_column_streak = 0
+    yield
+    genre_parser._parse_song_fields = genre_parser._parse_song_fields_counting
+    genre_parser._two_column_streak = 0
+
+
+class TestGenre:
+    def test_browse_genre(self, yt):
+        mock_response = load_genre_response()
+        with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response):
+            genre = yt.browse_genre("ggMPOg1uX1JOQWZFczlCblJ3")
+
+        assert genre["header"] == {"title": "Rock"}
+        assert len(genre["sections"]) == 4
+        assert [song["title"] for song in genre["songs"]] == [f"Song Title {i}" for i in (1, 2, 3)]
+        for song in genre["songs"]:
+            assert song["videoId"] and song["views"]
+            assert song["artists"][0]["name"] and song["artists"][0]["id"].startswith("UC")
+            assert song["album"]["id"].startswith("MPREb")
+        assert all(pl["resultType"] == "playlist" for pl in genre["playlists"])
+        assert {pl["title"] for pl in genre["playlists"]} == {
+            "Rock Classics",
+            "Indie Rock Hits",
+            "Garage Rock Revival",
+        }
+        assert genre["albums"][0]["title"] == "The Car"
+        assert genre["albums"][0]["subtitle"] == "Album • Arctic Monkeys"
+
+    def test_eager_thumbs_serializes(self, yt):
+        mock_response = load_genre_response()
+        with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response):
+            lazy = yt.browse_genre("params")
+            eager = yt.browse_genre("params", eager_thumbs=True)
+
+        # lazy proxies compare equal to their eager value but are not JSON
+        with pytest.raises(TypeError):
+            json.dumps(lazy)
+        json.dumps(eager)
+        assert lazy["songs"] == eager["songs"]
+        assert lazy["playlists"] == eager["playlists"]
+
+    def test_lightweight_items(self, yt):
+        mock_response = load_genre_response()
+        with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response):
+            genre = yt.browse_genre("params", lightweight=True)
+            plain = yt.browse_genre("params")
+
+        for item, expected in zip(genre["songs"] + genre["playlists"], plain["songs"] + plain["playlists"]):
+            assert not isinstance(item, dict)
+            assert dict(item) == expected
+            assert item["title"] == expected["title"]
+            assert item.get("missing", "fallback") == "fallback"
+            with pytest.raises(KeyError):
+                item["missing"]
+
+    def test_songs_view_threshold(self):
+        at_threshold = genre_parser.parse_genre_contents(make_shelf_response(64))
+        over_threshold = genre_parser.parse_genre_contents(make_shelf_response(65))
+
+        assert isinstance(at_threshold["songs"], list)
+        assert not isinstance(over_threshold["songs"], list)
+        assert len(over_threshold["songs"]) == 65
+
+        # the columnar view must be row-for-row equivalent to the dict path
+        reference = genre_parser.parse_genre_contents(make_shelf_response(65), eager_thumbs=True)
+        assert list(over_threshold["songs"]) == reference["songs"]
+        assert over_threshold["songs"][0] == reference["songs"][0]
+        assert over_threshold["songs"][-1] == reference["songs"][-1]
+        assert over_threshold["songs"][10:12] == reference["songs"][10:12]
+
+    def test_mixed_shelf_sizes(self):
+        page = genre_parser.parse_genre_contents(make_shelf_response(3, 70, 2))
+        assert isinstance(page["songs"], list)
+        assert len(page["songs"]) == 75
+        reference = genre_parser.parse_genre_contents(make_shelf_response(3, 70, 2), eager_thumbs=True)
+        assert page["songs"] == reference["songs"]
+
+    def test_lazy_thumbs_materialize(self):
+        thumbnails = [{"url": "https://example.com/img", "width": 226, "height": 226}]
+        renderer = {"thumbnail": {"thumbnails": thumbnails}}
+        lazy = genre_parser._LazyThumbs(renderer, ("thumbnail", "thumbnails"))
+
+        assert len(lazy) == 1
+        assert lazy[0]["url"] == "https://example.com/img"
+        assert list(lazy) == thumbnails
+        assert lazy == thumbnails
+        assert bool(lazy)
+        # materialization caches the value and releases the renderer subtree
+        assert lazy.materialize() is lazy.materialize()
+        assert lazy._renderer is None
+
+        missing = genre_parser._LazyThumbs({}, ("thumbnail", "thumbnails"))
+        assert missing.materialize() is None
+        assert len(missing) == 0 and not missing
+        with pytest.raises(IndexError):
+            missing[0]
+
+    def test_specializer_reverts_on_deviating_row(self, reset_specializer):
+        conforming = [make_song_item(i) for i in range(60)]
+        expected = [genre_parser._parse_song_fields_general(item) for item in conforming]
+
+        assert [genre_parser._parse_song_fields(item) for item in conforming] == expected
+        assert genre_parser._parse_song_fields is genre_parser._parse_song_fields_specialized
+
+        # a row without the second flex column must parse correctly and
+        # uninstall the guard-free variant
+        deviating = make_song_item(99, columns=1)
+        assert genre_parser._parse_song_fields(deviating) == genre_parser._parse_song_fields_general(
+            deviating
+        )
+        assert genre_parser._parse_song_fields is genre_parser._parse_song_fields_counting
+
+    def test_mood_cache(self, yt):
+        categories = {"Genres": [{"title": "Rock", "params": "p_rock"}, {"title": None, "params": "p_bad"}]}
+        with mock.patch.object(type(yt), "get_mood_categories", return_value=categories) as mock_moods:
+            yt.list_genres()
+            yt.list_genres()
+            assert mock_moods.call_count == 1
+
+            # expired entries are refetched
+            yt._mood_cache_ts -= yt.MOOD_CACHE_TTL + 1
+            yt.list_genres()
+            assert mock_moods.call_count == 2
+
+            yt.invalidate_mood_cache()
+            yt.list_genres()
+            assert mock_moods.call_count == 3
+
+            with mock.patch("ytmusicapi.YTMusic._send_request", return_value=load_genre_response()):
+                assert yt.get_genre("rock")["header"] == {"title": "Rock"}
+            assert yt.get_genre("jazz") is None
+
+    def test_browse_genres_fan_out(self, yt):
+        mock_response = load_genre_response()
+        params_list = [f"params_{i}" for i in range(5)]
+        with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response) as mock_send:
+            pages = yt.browse_genres(params_list, concurrency=3)
+
+        assert set(pages) == set(params_list)
+        assert mock_send.call_count == len(params_list)
+        for params in params_list:
+            assert pages[params]["header"] == {"title": "Rock"}
+            assert len(pages[params]["songs"]) == 3
+        # requested params reach the request body unchanged
+        sent_params = {call.args[1]["params"] for call in mock_send.call_args_list}
+        assert sent_params == set(params_list)
+
+
+def load_pure_genre_module():
+    """Load a copy of the genre parser with the compiled extension blocked."""
+    spec = importlib.util.find_spec("ytmusicapi.parsers.genre")
+    module = importlib.util.module_from_spec(spec)
+    # None in sys.modules makes the optional import raise ImportError,
+    # forcing the fresh copy onto the pure-Python helpers
+    with mock.patch.dict(sys.modules, {"ytmusicapi.parsers._genre_fast": None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class TestGenreFastExtension:
+    """Equivalence checks for the optional compiled parser helpers.
+
+    Skipped unless the extension was built (YTMUSICAPI_BUILD_EXT=1); when it
+    is present, every compiled helper must be output-identical to its
+    pure-Python counterpart.
+    """
+
+    def test_compiled_helpers_match_pure(self):
+        fast = pytest.importorskip("ytmusicapi.parsers._genre_fast")
+        pure = load_pure_genre_module()
+
+        response = load_genre_response()
+        assert fast._nav_contents(response) == pure._nav_contents(response)
+        assert fast._nav_contents({}) is None and pure._nav_contents({}) is None
+
+        shelf = fast._nav_contents(response)[0]["musicShelfRenderer"]
+        assert fast._nav_title(shelf) == pure._nav_title(shelf) == "Popular songs"
+        assert fast._nav_title({}) is None
+
+        for path in [("contents",), ("contents", 0), ("missing", "key")]:
+            assert fast._nav_path(shelf, path) == pure._nav_path(shelf, path)
+
+        for browse_id in [None, "", "UCkEmjYcVso7RQ_9hYQ1dVNg", "MPREb_abc", "MPSPabc", "VLRDCLAK5"]:
+            assert fast._get_type_from_browse_id(browse_id) == pure._get_type_from_browse_id(browse_id)
+
+        for text in ["1.2M views", "987K", "views", "Views counted", "No plays", "4B ", ""]:
+            assert fast._is_view_count(text) == pure._is_view_count(text)
+
+        rows = shelf["contents"] + [make_song_item(1), make_song_item(2, columns=1), {"otherRenderer": {}}]
+        for row in rows:
+            assert fast._parse_song_fields(row) == pure._parse_song_fields(row)
+
+    def test_compiled_page_parse_matches_pure(self):
+        pytest.importorskip("ytmusicapi.parsers._genre_fast")
+        pure = load_pure_genre_module()
+
+        def as_dicts(items):
+            # lightweight items from the two module copies are distinct
+            # classes, so compare their dict projections
+            return [item if isinstance(item, dict) else dict(item) for item in items]
+
+        for response in [load_genre_response(), make_shelf_response(3, 70)]:
+            for kwargs in [{}, {"eager_thumbs": True}, {"lightweight": True}]:
+                fast_page = genre_parser.parse_genre_contents(response, **kwargs)
+                pure_page = pure.parse_genre_contents(response, **kwargs)
+                assert fast_page["header"] == pure_page["header"]
+                for key in ("songs", "playlists", "albums", "artists"):
+                    assert as_dicts(fast_page[key]) == as_dicts(pure_page[key])
@@ -0,0 +1,46 @@
+"""JSON decoding for API responses.
+
+Uses the fastest decoder installed, falling back to the standard library:
+
+- orjson decodes the raw response bytes directly in C, several times faster
+  than the standard library on the large, deeply nested browse responses
+  returned by YouTube Music.
+- pysimdjson keeps SIMD scratch buffers inside its Parser object, so one
+  parser per thread is reused across requests instead of being rebuilt for
+  every response. The parsed document is materialized to plain dicts/lists
+  before it is returned: lazy simdjson proxies borrow the parser's reused
+  buffer and must not outlive the next request.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def json_loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+    try:
+        import threading
+
+        import simdjson
+
+        _local = threading.local()
+
+        def json_loads(data: bytes | str) -> Any:
+            parser = getattr(_local, "parser", None)
+            if parser is None:
+                parser = _local.parser = simdjson.Parser()
+            document = parser.parse(data)
+            if isinstance(document, simdjson.Object):
+                return document.as_dict()
+            if isinstance(document, simdjson.Array):
+                return document.as_list()
+            return document
+
+    except ImportError:
+        import json
+
+        def json_loads(data: bytes | str) -> Any:
+            return json.loads(data)
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 import requests
 from requests import Response
 
+from ytmusicapi._json import json_loads
 from ytmusicapi.constants import (
     OAUTH_CODE_URL,
     OAUTH_SCOPE,
@@ -78,7 +79,7 @@ class OAuthCredentials(Credentials):
     def get_code(self) -> AuthCodeDict:
         """Method for obtaining a new user auth code. First step of token creation."""
         code_response = self._send_request(OAUTH_CODE_URL, data={"scope": OAUTH_SCOPE})
-        return typing.cast(AuthCodeDict, code_response.json())
+        return typing.cast(AuthCodeDict, json_loads(code_response.content))
 
     def _send_request(self, url: str, data: JsonDict) -> Response:
         """Method for sending post requests with required client_id and User-Agent modifications"""
@@ -86,7 +87,7 @@ class OAuthCredentials(Credentials):
         data.update({"client_id": self.client_id})
         response = self._session.post(url, data, headers={"User-Agent": OAUTH_USER_AGENT})
         if response.status_code == 401:
-            data = response.json()
+            data = json_loads(response.content)
             issue = data.get("error")
             if issue == "unauthorized_client":
                 raise UnauthorizedOAuthClient("Token refresh error. Most likely client/token mismatch.")
@@ -112,7 +113,7 @@ class OAuthCredentials(Credentials):
                 "code": device_code,
             },
         )
-        return typing.cast(RefreshableTokenDict, response.json())
+        return typing.cast(RefreshableTokenDict, json_loads(response.content))
 
     def refresh_token(self, refresh_token: str) -> BaseTokenDict:
         """
@@ -131,4 +132,4 @@ class OAuthCredentials(Credentials):
             },
         )
 
-        return typing.cast(BaseTokenDict, response.json())
+        return typing.cast(BaseTokenDict, json_loads(response.content))
@@ -1,4 +1,3 @@
-import json
 import locale
 import re
 import time
@@ -10,6 +9,7 @@ from http.cookies import SimpleCookie
 from requests import Response
 from requests.structures import CaseInsensitiveDict
 
+from ytmusicapi._json import json_loads
 from ytmusicapi.constants import *
 from ytmusicapi.type_alias import JsonDict
 
@@ -44,7 +44,7 @@ def get_visitor_id(request_func: Callable[[str], Response]) -> dict[str, str]:
     matches = re.findall(r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;", response.text)
     visitor_id = ""
     if len(matches) > 0:
-        ytcfg = json.loads(matches[0])
+        ytcfg = json_loads(matches[0])
         visitor_id = ytcfg.get("VISITOR_DATA")
     return {"X-Goog-Visitor-Id": visitor_id}
 
@@ -2,6 +2,10 @@
 Genre browsing mixin for YTMusic.
 """
 
+import asyncio
+import time
+from collections.abc import Iterable
+from functools import partial
 from typing import Optional
 from ..parsers.genre import parse_genre_contents
 
@@ -9,7 +13,34 @@ from ..parsers.genre import parse_genre_contents
 class GenreMixin:
     """Mixin class for genre browsing functionality."""
 
-    def browse_genre(self, params: str) -> dict:
+    #: how long a cached get_mood_categories() result stays valid, in seconds.
+    #: The moods & genres page changes on the order of days, so an hour is safe.
+    MOOD_CACHE_TTL = 3600
+
+    def _cached_mood_categories(self, ttl: float = MOOD_CACHE_TTL) -> dict:
+        """
+        Return :py:func:`get_mood_categories` results, fetching at most once per TTL.
+
+        Browsing several genres in a row would otherwise refetch and re-parse
+        the same multi-hundred-KB moods & genres response for every call.
+        """
+        now = time.monotonic()
+        if getattr(self, "_mood_cache", None) is None or now - self._mood_cache_ts > ttl:
+            self._mood_cache = self.get_mood_categories()
+            self._mood_cache_ts = now
+            self._genre_index = {
+                item["title"].lower(): (category, item["params"])
+                for category, items in self._mood_cache.items()
+                for item in items
+                if item.get("title") and item.get("params")
+            }
+        return self._mood_cache
+
+    def invalidate_mood_cache(self) -> None:
+        """Drop the cached mood categories so the next call refetches them."""
+        self._mood_cache = None
+
+    def browse_genre(self, params: str, *, lightweight: bool = False, eager_thumbs: bool = False) -> dict:
         """
         Get contents of a genre page (songs, playlists, etc.).
 
@@ -17,12 +48,22 @@ class GenreMixin:
 
         :param params: The params value from get_mood_categories() results.
             Example: "ggMPOg1uX1JOQWZFczlCblJ3" for Rock
+        :param lightweight: Return slotted item objects instead of dicts.
+            They support key access (``item['title']``, ``item.get(...)``,
+            ``dict(item)``) but use less memory per item. Default: False
+        :param eager_thumbs: Resolve thumbnails while parsing instead of
+            returning lazy list-like proxies. Lazy proxies behave like lists
+            (iteration, indexing, ``len``, equality) but are not JSON
+            serializable; pass True when the result is fed to
+            ``json.dumps`` or similar. Default: False
         :return: Dict containing:
             - header: Genre title and optional thumbnail
-            - songs: List of song dicts with title, artists, views, album, videoId
-            - playlists: List of playlist dicts with title, subtitle, browseId
-            - albums: List of album dicts (if present)
-            - artists: List of artist dicts (if present)
+            - songs: Sequence of song items with title, artists, views, album,
+              videoId. A plain list for small pages; large shelves are served
+              through a list-like view backed by column storage
+            - playlists: List of playlist items with title, subtitle, browseId
+            - albums: List of album items (if present)
+            - artists: List of artist items (if present)
             - sections: Raw parsed sections for custom handling
 
         Example::
@@ -47,19 +88,78 @@ class GenreMixin:
             for pl in genre['playlists']:
                 print(f"{pl['title']}")
         """
-        body = {
-            "browseId": "FEmusic_moods_and_genres_category",
-            "params": params
-        }
+        body = {"browseId": "FEmusic_moods_and_genres_category", "params": params}
 
         response = self._send_request("browse", body)
-        return parse_genre_contents(response)
+        return parse_genre_contents(response, lightweight=lightweight, eager_thumbs=eager_thumbs)
+
+    def browse_genres(
+        self,
+        params_list: Iterable[str],
+        *,
+        concurrency: int = 8,
+        lightweight: bool = False,
+        eager_thumbs: bool = False,
+    ) -> dict:
+        """
+        Get contents of several genre pages concurrently.
+
+        Sequential :py:func:`browse_genre` calls pay one network round-trip
+        each; fetching them concurrently overlaps the waits (and the parsing),
+        so a batch completes in roughly the time of the slowest request.
+
+        :param params_list: params values from :py:func:`get_mood_categories` results
+        :param concurrency: Maximum number of requests in flight. Default: 8
+        :param lightweight: Passed through to :py:func:`browse_genre`
+        :param eager_thumbs: Passed through to :py:func:`browse_genre`
+        :return: Dict mapping each params value to its parsed genre page,
+            in the format of :py:func:`browse_genre`
+
+        Example::
 
-    def get_genre(self, genre_name: str) -> Optional[dict]:
+            genres = yt.list_genres()
+            pages = yt.browse_genres([g['params'] for g in genres[:5]])
+            for params, page in pages.items():
+                print(page['header']['title'], len(page['songs']))
+        """
+        return asyncio.run(
+            self.browse_genres_async(
+                params_list, concurrency=concurrency, lightweight=lightweight, eager_thumbs=eager_thumbs
+            )
+        )
+
+    async def browse_genres_async(
+        self,
+        params_list: Iterable[str],
+        *,
+        concurrency: int = 8,
+        lightweight: bool = False,
+        eager_thumbs: bool = False,
+    ) -> dict:
+        """
+        Async version of :py:func:`browse_genres` for callers with a running
+        event loop. Each request (and its parse) runs in a worker thread via
+        :py:func:`asyncio.to_thread`, bounded by a semaphore, so the loop is
+        never blocked.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        browse = partial(self.browse_genre, lightweight=lightweight, eager_thumbs=eager_thumbs)
+
+        async def fetch(params: str) -> tuple[str, dict]:
+            async with semaphore:
+                return params, await asyncio.to_thread(browse, params)
+
+        return dict(await asyncio.gather(*(fetch(params) for params in params_list)))
+
+    def get_genre(
+        self, genre_name: str, *, lightweight: bool = False, eager_thumbs: bool = False
+    ) -> Optional[dict]:
         """
         Convenience method to browse a genre by name.
 
         :param genre_name: Name of the genre (e.g., "Rock", "Pop", "Hip-Hop")
+        :param lightweight: Passed through to :py:func:`browse_genre`
+        :param eager_thumbs: Passed through to :py:func:`browse_genre`
         :return: Genre page contents, or None if genre not found
 
         Example::
@@ -68,14 +168,11 @@ class GenreMixin:
             if rock:
                 print(f"Found {len(rock['songs'])} songs")
         """
-        categories = self.get_mood_categories()
-
-        for cat_items in categories.values():
-            for item in cat_items:
-                if item.get("title", "").lower() == genre_name.lower():
-                    return self.browse_genre(item["params"])
-
-        return None
+        self._cached_mood_categories()
+        entry = self._genre_index.get(genre_name.lower())
+        if not entry:
+            return None
+        return self.browse_genre(entry[1], lightweight=lightweight, eager_thumbs=eager_thumbs)
 
     def list_genres(self) -> list[dict]:
         """
@@ -89,15 +186,9 @@ class GenreMixin:
             for g in genres:
                 print(f"{g['title']} ({g['category']})")
         """
-        categories = self.get_mood_categories()
-        genres = []
-
-        for category_name, items in categories.items():
-            for item in items:
-                genres.append({
-                    "category": category_name,
-                    "title": item.get("title"),
-                    "params": item.get("params")
-                })
-
-        return genres
+        categories = self._cached_mood_categories()
+        return [
+            {"category": category_name, "title": item.get("title"), "params": item.get("params")}
+            for category_name, items in categories.items()
+            for item in items
+        ]
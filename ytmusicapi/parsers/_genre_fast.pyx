@@ -0,0 +1,110 @@
+# cython: language_level=3, boundscheck=False
+"""Cython-compiled fast paths for the genre parser.
+
+Mirrors the leaf helpers of :py:mod:`ytmusicapi.parsers.genre`; keep the two
+in sync. The extension is only built when ``YTMUSICAPI_BUILD_EXT=1`` is set
+(see setup.py) and the package falls back to the pure-Python implementations
+when it is absent, so source-only installs are unaffected.
+"""
+
+import re
+import sys
+
+_VIDEO_ID_PATH = ("navigationEndpoint", "watchEndpoint", "videoId")
+_BROWSE_ID_PATH = ("navigationEndpoint", "browseEndpoint", "browseId")
+
+_VIEW_COUNT_RE = re.compile(r"(?i:view)|[MKB]\s*$")
+
+
+def _nav_contents(dict response):
+    """Unrolled nav() for the section list of a genre browse response."""
+    try:
+        return response["contents"]["singleColumnBrowseResultsRenderer"]["tabs"][0]["tabRenderer"][
+            "content"
+        ]["sectionListRenderer"]["contents"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _nav_title(dict renderer):
+    """Unrolled nav() for TITLE_TEXT."""
+    try:
+        return renderer["title"]["runs"][0]["text"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _nav_path(root, tuple path):
+    """nav() specialized for the precompiled tuple paths."""
+    try:
+        for key in path:
+            root = root[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return root
+
+
+def _get_type_from_browse_id(browse_id):
+    """Determine content type from browse ID prefix."""
+    cdef str prefix
+    if not browse_id:
+        return "playlist"
+    prefix = browse_id[:2]
+    if prefix == "UC":
+        return "artist"
+    if prefix == "MP" and browse_id[:4] == "MPRE":
+        return "album"
+    return "playlist"
+
+
+def _is_view_count(text):
+    """Check if text looks like a view count."""
+    return _VIEW_COUNT_RE.search(text) is not None
+
+
+def _parse_song_fields(dict item):
+    """Extract song fields in _SONG_FIELDS order.
+
+    The last element is the raw renderer rather than resolved thumbnails;
+    callers decide between an eager walk and a _LazyThumbs proxy.
+    """
+    cdef dict renderer, col, run
+    cdef list flex_columns, runs, artists
+    cdef str text, prefix
+
+    if "musicResponsiveListItemRenderer" not in item:
+        return None
+
+    renderer = item["musicResponsiveListItemRenderer"]
+    flex_columns = renderer.get("flexColumns", [])
+
+    title = video_id = album = views = None
+    artists = []
+
+    if len(flex_columns) > 0:
+        col = flex_columns[0].get("musicResponsiveListItemFlexColumnRenderer", {})
+        runs = _nav_path(col, ("text", "runs")) or []
+        if runs:
+            title = runs[0].get("text")
+            video_id = _nav_path(runs[0], _VIDEO_ID_PATH)
+
+    if len(flex_columns) > 1:
+        col = flex_columns[1].get("musicResponsiveListItemFlexColumnRenderer", {})
+        runs = _nav_path(col, ("text", "runs")) or []
+
+        for run in runs:
+            text = run.get("text", "")
+            browse_id = _nav_path(run, _BROWSE_ID_PATH)
+
+            if browse_id:
+                prefix = browse_id[:2]
+                # intern names: the same artist/album string appears in many
+                # songs of a page but arrives as a distinct object per song
+                if prefix == "UC":
+                    artists.append({"name": sys.intern(text), "id": browse_id})
+                elif prefix == "MP" and browse_id[:5] == "MPREb":
+                    album = {"name": sys.intern(text), "id": browse_id}
+            elif _VIEW_COUNT_RE.search(text) is not None:
+                views = text
+
+    return title, video_id, artists, album, views, renderer
@@ -2,239 +2,573 @@
 Parsers for genre browse pages.
 """
 
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
+from typing import Any
+
 from ._utils import *
-from ..navigation import nav, TITLE_TEXT, THUMBNAIL_RENDERER, THUMBNAILS
-
-
-def parse_genre_contents(response: dict) -> dict:
-    """Parse the full genre page response."""
-    results = {
-        "header": None,
-        "songs": [],
-        "playlists": [],
-        "albums": [],
-        "artists": [],
-        "sections": []
-    }
+from ..navigation import TITLE_TEXT, THUMBNAIL_RENDERER, THUMBNAILS
 
-    results["header"] = parse_genre_header(response)
+# fixed navigation paths, precompiled to tuples so the hot parse functions
+# neither allocate a path list per call nor pay nav()'s per-step dispatch
+_CAROUSEL_TITLE_PATH = ("header", "musicCarouselShelfBasicHeaderRenderer", *TITLE_TEXT)
+_GRID_TITLE_PATH = ("header", "gridHeaderRenderer", *TITLE_TEXT)
+_BROWSE_ID_PATH = ("navigationEndpoint", "browseEndpoint", "browseId")
+_VIDEO_ID_PATH = ("navigationEndpoint", "watchEndpoint", "videoId")
+_TWO_ROW_THUMBNAILS_PATH = ("thumbnailRenderer", *THUMBNAIL_RENDERER, *THUMBNAILS)
+_THUMBNAILS_PATH = ("thumbnail", *THUMBNAIL_RENDERER, *THUMBNAILS)
 
-    contents = nav(response, [
-        "contents", "singleColumnBrowseResultsRenderer",
-        "tabs", 0, "tabRenderer", "content",
-        "sectionListRenderer", "contents"
-    ], True)
+_TEXT_GET = itemgetter("text")
 
-    if not contents:
-        return results
+#: "view" anywhere (any case) or a count abbreviated with M/K/B before
+#: trailing whitespace, e.g. "1.2M views" or "987K"
+_VIEW_COUNT_RE = re.compile(r"(?i:view)|[MKB]\s*$")
 
-    for section in contents:
-        parsed = parse_genre_section(section)
-        if parsed:
-            results["sections"].append(parsed)
-            _categorize_section(results, parsed)
 
-    return results
+_UNRESOLVED = object()
+
+
+class _LazyThumbs:
+    """Thumbnail list that resolves its nav path on first access.
+
+    Most callers never read thumbnails, so deferring the walk skips one
+    renderer navigation per item on the page. Iteration, indexing, len(),
+    truthiness and equality all behave like the list (or None) the eager
+    path would have produced.
+    """
+
+    __slots__ = ("_path", "_renderer", "_value")
+
+    def __init__(self, renderer: dict, path: tuple):
+        self._renderer = renderer
+        self._path = path
+        self._value = _UNRESOLVED
+
+    def materialize(self) -> list | None:
+        """Resolve and return the underlying thumbnail list (or None)."""
+        if self._value is _UNRESOLVED:
+            self._value = _nav_path(self._renderer, self._path)
+            self._renderer = None  # release the renderer subtree
+        return self._value
+
+    def __iter__(self):
+        return iter(self.materialize() or ())
+
+    def __len__(self) -> int:
+        value = self.materialize()
+        return len(value) if value else 0
+
+    def __getitem__(self, index):
+        value = self.materialize()
+        if value is None:
+            raise IndexError(index)
+        return value[index]
+
+    def __bool__(self) -> bool:
+        return bool(self.materialize())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _LazyThumbs):
+            other = other.materialize()
+        return self.materialize() == other
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+
+class _SlottedItem:
+    """Dict-like facade shared by the lightweight result classes.
+
+    A ``__slots__`` instance is a fraction of the size of a result dict and
+    its fields are read via an indexed C lookup instead of a hash probe.
+    ``__getitem__``/``get``/``keys`` keep subscription, ``.get()`` and
+    ``dict(item)`` working for callers that expect plain dicts.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def keys(self) -> tuple:
+        return self.__slots__
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Song(_SlottedItem):
+    """Lightweight stand-in for the song dict built by :py:func:`parse_genre_song`."""
+
+    __slots__ = ("album", "artists", "resultType", "thumbnails", "title", "videoId", "views")
+
+    def __init__(self, title=None, video_id=None, artists=None, album=None, views=None, thumbnails=None):
+        self.resultType = "song"
+        self.title = title
+        self.videoId = video_id
+        self.artists = [] if artists is None else artists
+        self.album = album
+        self.views = views
+        self.thumbnails = thumbnails
+
+
+class TwoRowItem(_SlottedItem):
+    """Lightweight stand-in for the card dict built by :py:func:`parse_two_row_item`."""
+
+    __slots__ = ("browseId", "resultType", "subtitle", "thumbnails", "title")
+
+    def __init__(self, result_type, title=None, subtitle=None, browse_id=None, thumbnails=None):
+        self.resultType = result_type
+        self.title = title
+        self.subtitle = subtitle
+        self.browseId = browse_id
+        self.thumbnails = thumbnails
+
+
+def _nav_contents(response: dict) -> list | None:
+    """Unrolled nav() for the section list of a genre browse response."""
+    try:
+        return response["contents"]["singleColumnBrowseResultsRenderer"]["tabs"][0]["tabRenderer"]["content"][
+            "sectionListRenderer"
+        ]["contents"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _nav_title(renderer: dict) -> str | None:
+    """Unrolled nav() for TITLE_TEXT."""
+    try:
+        return renderer["title"]["runs"][0]["text"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _nav_path(root: Any, path: tuple) -> Any | None:
+    """nav() specialized for the precompiled tuple paths above."""
+    try:
+        for key in path:
+            root = root[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return root
+
+
+def parse_genre_contents(
+    response: dict, *, lightweight: bool = False, eager_thumbs: bool = False, parallel: bool = False
+) -> dict:
+    """Parse the full genre page response.
+
+    :param response: Browse response for a genre page.
+    :param lightweight: Return :py:class:`Song`/:py:class:`TwoRowItem` instances
+        instead of plain dicts. They subscript and ``.get()`` like dicts but use
+        a fraction of the memory, which pays off on pages with hundreds of items.
+    :param eager_thumbs: Resolve thumbnail lists while parsing. By default they
+        are wrapped in a list-like lazy proxy that only walks the renderer when
+        the thumbnails are actually read.
+    :param parallel: Parse sections on a small thread pool. Sections are
+        independent, but pure-Python dict walking holds the GIL, so this only
+        pays off when the compiled ``_genre_fast`` helpers are installed.
+    """
+    header = parse_genre_header(response)
+    contents = _nav_contents(response) or ()
+
+    section_parse = partial(parse_genre_section, lightweight=lightweight, eager_thumbs=eager_thumbs)
+    if parallel and len(contents) > 1:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            parsed_sections = list(executor.map(section_parse, contents))
+    else:
+        parsed_sections = map(section_parse, contents)
+
+    # categorize in the same pass instead of re-reading every section afterwards
+    sections: list = []
+    buckets: dict = {"songs": [], "playlists": [], "albums": [], "artists": []}
+
+    for parsed in parsed_sections:
+        if parsed is None:
+            continue
+        sections.append(parsed)
+
+        bucket = buckets.get(parsed["type"])
+        if bucket is None:
+            continue
+        items = parsed["items"]
+        if isinstance(items, SongsView) and not bucket:
+            # keep columnar storage intact for the common single-shelf page;
+            # extending would rebuild one dict per song
+            buckets[parsed["type"]] = items
+        else:
+            if isinstance(bucket, SongsView):
+                bucket = buckets[parsed["type"]] = list(bucket)
+            bucket.extend(items)
+
+    return {"header": header, **buckets, "sections": sections}
 
 
 def parse_genre_header(response: dict) -> dict | None:
     """Parse genre page header."""
-    header = response.get("header", {})
+    header = response.get("header")
+    if not header:
+        return None
 
-    if "musicHeaderRenderer" in header:
-        return {
-            "title": nav(header, ["musicHeaderRenderer", *TITLE_TEXT], True)
-        }
+    mhr = header.get("musicHeaderRenderer")
+    if mhr is not None:
+        return {"title": _nav_title(mhr)}
 
-    if "musicImmersiveHeaderRenderer" in header:
-        ihr = header["musicImmersiveHeaderRenderer"]
-        return {
-            "title": nav(ihr, TITLE_TEXT, True),
-            "thumbnail": nav(ihr, ["thumbnail", *THUMBNAIL_RENDERER, *THUMBNAILS], True)
-        }
+    ihr = header.get("musicImmersiveHeaderRenderer")
+    if ihr is not None:
+        return {"title": _nav_title(ihr), "thumbnail": _nav_path(ihr, _THUMBNAILS_PATH)}
 
     return None
 
 
-def parse_genre_section(section: dict) -> dict | None:
+def parse_genre_section(
+    section: dict, *, lightweight: bool = False, eager_thumbs: bool = False
+) -> dict | None:
     """Route section to appropriate parser."""
-    if "musicCarouselShelfRenderer" in section:
-        return parse_carousel_shelf(section["musicCarouselShelfRenderer"])
-
-    if "musicShelfRenderer" in section:
-        return parse_music_shelf(section["musicShelfRenderer"])
-
-    if "gridRenderer" in section:
-        return parse_grid_renderer(section["gridRenderer"])
+    # sections carry a single renderer key, so one pass over the (tiny)
+    # dict plus a table lookup beats chained membership tests
+    for key, renderer in section.items():
+        parser = _SECTION_DISPATCH.get(key)
+        if parser is not None:
+            return parser(renderer, lightweight=lightweight, eager_thumbs=eager_thumbs)
 
     return None
 
 
-def parse_carousel_shelf(shelf: dict) -> dict:
+def parse_carousel_shelf(shelf: dict, *, lightweight: bool = False, eager_thumbs: bool = False) -> dict:
     """Parse horizontal carousel (playlists, albums, artists)."""
-    result = {
-        "title": nav(shelf, [
-            "header", "musicCarouselShelfBasicHeaderRenderer", *TITLE_TEXT
-        ], True),
-        "type": "unknown",
-        "items": []
-    }
+    # locals instead of repeated dict subscripts in the loop body:
+    # LOAD_FAST vs. a hash lookup per iteration
+    items: list = []
+    items_append = items.append
+    section_type = "unknown"
 
     for item in shelf.get("contents", []):
-        parsed = parse_two_row_item(item)
+        parsed = parse_two_row_item(item, lightweight=lightweight, eager_thumbs=eager_thumbs)
         if parsed:
-            result["items"].append(parsed)
-            if result["type"] == "unknown":
-                result["type"] = parsed.get("resultType", "unknown") + "s"
+            items_append(parsed)
+            if section_type == "unknown":
+                # intern: the concatenation would otherwise mint a fresh
+                # "playlists"/"albums"/"artists" per carousel, while the
+                # interned singleton makes the bucket lookup in
+                # parse_genre_contents an identity match
+                section_type = sys.intern(parsed.get("resultType", "unknown") + "s")
 
-    return result
+    return {"title": _nav_path(shelf, _CAROUSEL_TITLE_PATH), "type": section_type, "items": items}
 
 
-def parse_two_row_item(item: dict) -> dict | None:
+def parse_two_row_item(
+    item: dict, *, lightweight: bool = False, eager_thumbs: bool = False
+) -> dict | TwoRowItem | None:
     """Parse musicTwoRowItemRenderer (playlist/album/artist cards)."""
     if "musicTwoRowItemRenderer" not in item:
         return None
 
     renderer = item["musicTwoRowItemRenderer"]
 
-    title = nav(renderer, TITLE_TEXT, True)
+    title = _nav_title(renderer)
 
-    subtitle_runs = nav(renderer, ["subtitle", "runs"], True) or []
-    subtitle = "".join([r.get("text", "") for r in subtitle_runs])
+    subtitle_runs = _nav_path(renderer, ("subtitle", "runs")) or []
+    try:
+        # itemgetter is a C-level callable; runs virtually always carry "text"
+        subtitle = "".join(map(_TEXT_GET, subtitle_runs))
+    except KeyError:
+        subtitle = "".join(r.get("text", "") for r in subtitle_runs)
 
-    browse_id = nav(renderer, [
-        "navigationEndpoint", "browseEndpoint", "browseId"
-    ], True)
+    browse_id = _nav_path(renderer, _BROWSE_ID_PATH)
 
-    thumbnails = nav(renderer, [
-        "thumbnailRenderer", *THUMBNAIL_RENDERER, *THUMBNAILS
-    ], True)
+    if eager_thumbs:
+        thumbnails = _nav_path(renderer, _TWO_ROW_THUMBNAILS_PATH)
+    else:
+        thumbnails = _LazyThumbs(renderer, _TWO_ROW_THUMBNAILS_PATH)
 
     result_type = _get_type_from_browse_id(browse_id)
 
+    if lightweight:
+        return TwoRowItem(result_type, title, subtitle, browse_id, thumbnails)
+
     return {
         "resultType": result_type,
         "title": title,
         "subtitle": subtitle,
         "browseId": browse_id,
-        "thumbnails": thumbnails
+        "thumbnails": thumbnails,
     }
 
 
-def parse_music_shelf(shelf: dict) -> dict:
+#: shelves longer than this are parsed into parallel columns (SoA) instead
+#: of one dict per song, cutting per-row allocations roughly sevenfold
+_SOA_THRESHOLD = 64
+
+_SONG_FIELDS = ("title", "videoId", "artists", "album", "views", "thumbnails")
+
+
+class SongsView:
+    """Sequence facade over column-oriented song storage.
+
+    Rebuilds the per-song dict on access, so iteration and indexing work
+    exactly like a list of song dicts while the shelf itself is stored as
+    one list per field.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: dict):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["title"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        columns = self.columns
+        song = {"resultType": "song"}
+        for field in _SONG_FIELDS:
+            song[field] = columns[field][index]
+        return song
+
+
+def parse_music_shelf(shelf: dict, *, lightweight: bool = False, eager_thumbs: bool = False) -> dict:
     """Parse vertical song list shelf."""
-    result = {
-        "title": nav(shelf, TITLE_TEXT, True),
-        "type": "songs",
-        "items": []
-    }
+    contents = shelf.get("contents", [])
+    if len(contents) > _SOA_THRESHOLD and not eager_thumbs:
+        # columnar storage is already the compact representation; eager
+        # callers asked for plain data they can serialize, so skip it
+        return parse_music_shelf_soa(shelf)
 
-    for item in shelf.get("contents", []):
-        parsed = parse_genre_song(item)
+    items: list = []
+    items_append = items.append
+
+    for item in contents:
+        parsed = parse_genre_song(item, lightweight=lightweight, eager_thumbs=eager_thumbs)
         if parsed:
-            result["items"].append(parsed)
+            items_append(parsed)
+
+    return {"title": _nav_title(shelf), "type": "songs", "items": items}
+
+
+def parse_music_shelf_soa(shelf: dict, *, eager_thumbs: bool = False) -> dict:
+    """Parse song list shelf into one list per field instead of dict-per-song."""
+    columns: dict = {field: [] for field in _SONG_FIELDS}
+    appends = tuple(columns[field].append for field in _SONG_FIELDS[:-1])
+    thumbs_append = columns["thumbnails"].append
+
+    for item in shelf.get("contents", []):
+        fields = _parse_song_fields(item)
+        if fields is None:
+            continue
+        for append, value in zip(appends, fields):
+            append(value)
+        thumbs_append(_song_thumbs(fields[-1], eager_thumbs))
 
-    return result
+    return {"title": _nav_title(shelf), "type": "songs", "columns": columns, "items": SongsView(columns)}
 
 
-def parse_genre_song(item: dict) -> dict | None:
+def _song_thumbs(renderer: dict, eager_thumbs: bool) -> Any:
+    """Thumbnails for a song renderer, resolved now or behind a lazy proxy."""
+    if eager_thumbs:
+        return _nav_path(renderer, _THUMBNAILS_PATH)
+    return _LazyThumbs(renderer, _THUMBNAILS_PATH)
+
+
+def parse_genre_song(
+    item: dict, *, lightweight: bool = False, eager_thumbs: bool = False
+) -> dict | Song | None:
     """Parse song from musicResponsiveListItemRenderer."""
+    fields = _parse_song_fields(item)
+    if fields is None:
+        return None
+
+    title, video_id, artists, album, views, renderer = fields
+    thumbnails = _song_thumbs(renderer, eager_thumbs)
+
+    if lightweight:
+        return Song(title, video_id, artists, album, views, thumbnails)
+
+    return {
+        "resultType": "song",
+        "title": title,
+        "videoId": video_id,
+        "artists": artists,
+        "album": album,
+        "views": views,
+        "thumbnails": thumbnails,
+    }
+
+
+def _parse_song_fields(item: dict) -> tuple | None:
+    """Extract song fields in :py:data:`_SONG_FIELDS` order.
+
+    The last element is the raw renderer rather than resolved thumbnails;
+    callers decide between an eager walk and a :py:class:`_LazyThumbs` proxy.
+    """
     if "musicResponsiveListItemRenderer" not in item:
         return None
 
     renderer = item["musicResponsiveListItemRenderer"]
     flex_columns = renderer.get("flexColumns", [])
 
-    song = {
-        "resultType": "song",
-        "title": None,
-        "videoId": None,
-        "artists": [],
-        "album": None,
-        "views": None,
-        "thumbnails": None
-    }
+    title = video_id = album = views = None
+    artists: list = []
 
     if len(flex_columns) > 0:
         col = flex_columns[0].get("musicResponsiveListItemFlexColumnRenderer", {})
-        runs = nav(col, ["text", "runs"], True) or []
+        runs = _nav_path(col, ("text", "runs")) or []
         if runs:
-            song["title"] = runs[0].get("text")
-            song["videoId"] = nav(runs[0], [
-                "navigationEndpoint", "watchEndpoint", "videoId"
-            ], True)
+            title = runs[0].get("text")
+            video_id = _nav_path(runs[0], _VIDEO_ID_PATH)
 
     if len(flex_columns) > 1:
         col = flex_columns[1].get("musicResponsiveListItemFlexColumnRenderer", {})
-        runs = nav(col, ["text", "runs"], True) or []
+        runs = _nav_path(col, ("text", "runs")) or []
 
         for run in runs:
             text = run.get("text", "")
-            browse_id = nav(run, [
-                "navigationEndpoint", "browseEndpoint", "browseId"
-            ], True)
+            browse_id = _nav_path(run, _BROWSE_ID_PATH)
 
             if browse_id:
-                if browse_id.startswith("UC"):
-                    song["artists"].append({"name": text, "id": browse_id})
-                elif browse_id.startswith("MPREb"):
-                    song["album"] = {"name": text, "id": browse_id}
+                prefix = browse_id[:2]
+                # intern names: the same artist/album string appears in many
+                # songs of a page but arrives as a distinct object per song
+                if prefix == "UC":
+                    artists.append({"name": sys.intern(text), "id": browse_id})
+                elif prefix == "MP" and browse_id[:5] == "MPREb":
+                    album = {"name": sys.intern(text), "id": browse_id}
             elif _is_view_count(text):
-                song["views"] = text
-
-    song["thumbnails"] = nav(renderer, [
-        "thumbnail", *THUMBNAIL_RENDERER, *THUMBNAILS
-    ], True)
+                views = text
 
-    return song
+    return title, video_id, artists, album, views, renderer
 
 
-def parse_grid_renderer(grid: dict) -> dict:
+def parse_grid_renderer(grid: dict, *, lightweight: bool = False, eager_thumbs: bool = False) -> dict:
     """Parse grid layout."""
-    result = {
-        "title": nav(grid, ["header", "gridHeaderRenderer", *TITLE_TEXT], True),
-        "type": "playlists",
-        "items": []
-    }
+    items: list = []
+    items_append = items.append
 
     for item in grid.get("items", []):
-        parsed = parse_two_row_item(item)
+        parsed = parse_two_row_item(item, lightweight=lightweight, eager_thumbs=eager_thumbs)
         if parsed:
-            result["items"].append(parsed)
+            items_append(parsed)
+
+    return {"title": _nav_path(grid, _GRID_TITLE_PATH), "type": "playlists", "items": items}
+
 
-    return result
+#: renderer key -> section parser, used by :py:func:`parse_genre_section`
+_SECTION_DISPATCH = {
+    "musicCarouselShelfRenderer": parse_carousel_shelf,
+    "musicShelfRenderer": parse_music_shelf,
+    "gridRenderer": parse_grid_renderer,
+}
 
 
 def _get_type_from_browse_id(browse_id: str | None) -> str:
     """Determine content type from browse ID prefix."""
+    # slice comparisons instead of chained startswith(): the two-char slice
+    # settles "UC" and rules most playlist IDs out before the longer compare
     if not browse_id:
         return "playlist"
-    if browse_id.startswith("MPRE"):
-        return "album"
-    if browse_id.startswith("UC"):
+    prefix = browse_id[:2]
+    if prefix == "UC":
         return "artist"
+    if prefix == "MP" and browse_id[:4] == "MPRE":
+        return "album"
     return "playlist"
 
 
 def _is_view_count(text: str) -> bool:
     """Check if text looks like a view count."""
-    text_lower = text.lower()
-    return ("view" in text_lower or
-            text.rstrip().endswith("M") or
-            text.rstrip().endswith("K") or
-            text.rstrip().endswith("B"))
-
-
-def _categorize_section(results: dict, section: dict) -> None:
-    """Add section items to appropriate category list."""
-    section_type = section.get("type", "")
-    items = section.get("items", [])
-
-    if section_type == "songs":
-        results["songs"].extend(items)
-    elif section_type == "playlists":
-        results["playlists"].extend(items)
-    elif section_type == "albums":
-        results["albums"].extend(items)
-    elif section_type == "artists":
-        results["artists"].extend(items)
+    return _VIEW_COUNT_RE.search(text) is not None
+
+
+try:
+    # compiled fast paths (optional, built with YTMUSICAPI_BUILD_EXT=1);
+    # overrides the pure-Python helpers above when the extension is present
+    from ._genre_fast import (  # type: ignore[import-not-found,no-redef]
+        _get_type_from_browse_id,
+        _is_view_count,
+        _nav_contents,
+        _nav_path,
+        _nav_title,
+        _parse_song_fields,
+    )
+except ImportError:
+    pass
+
+
+# --- runtime specialization -------------------------------------------------
+# Genre responses have a very stable shape: song rows virtually always carry
+# exactly two flex columns. Once that has held for _SPECIALIZE_AFTER
+# consecutive rows, _parse_song_fields is rebound to a variant with the
+# length guards removed and the column indices inlined; any deviating row
+# falls back to the general parser and reverts the rebinding, so correctness
+# never depends on the observed shape.
+
+#: consecutive two-column rows to observe before installing the fast variant
+_SPECIALIZE_AFTER = 50
+
+_parse_song_fields_general = _parse_song_fields
+_two_column_streak = 0
+
+
+def _parse_song_fields_counting(item: dict) -> tuple | None:
+    """General parse that tracks shape stability and installs the fast variant."""
+    global _parse_song_fields, _two_column_streak
+    renderer = item.get("musicResponsiveListItemRenderer")
+    if renderer is not None and len(renderer.get("flexColumns", ())) == 2:
+        _two_column_streak += 1
+        if _two_column_streak >= _SPECIALIZE_AFTER:
+            _parse_song_fields = _parse_song_fields_specialized
+    else:
+        _two_column_streak = 0
+    return _parse_song_fields_general(item)
+
+
+def _parse_song_fields_specialized(item: dict) -> tuple | None:
+    """Two-column fast path; a deviating row reverts to the general parse."""
+    global _parse_song_fields, _two_column_streak
+    try:
+        renderer = item["musicResponsiveListItemRenderer"]
+        flex_columns = renderer["flexColumns"]
+        col0 = flex_columns[0]["musicResponsiveListItemFlexColumnRenderer"]
+        col1 = flex_columns[1]["musicResponsiveListItemFlexColumnRenderer"]
+    except (KeyError, IndexError, TypeError):
+        _parse_song_fields = _parse_song_fields_counting
+        _two_column_streak = 0
+        return _parse_song_fields_general(item)
+
+    title = video_id = album = views = None
+    artists: list = []
+
+    runs = _nav_path(col0, ("text", "runs")) or []
+    if runs:
+        title = runs[0].get("text")
+        video_id = _nav_path(runs[0], _VIDEO_ID_PATH)
+
+    for run in _nav_path(col1, ("text", "runs")) or []:
+        text = run.get("text", "")
+        browse_id = _nav_path(run, _BROWSE_ID_PATH)
+
+        if browse_id:
+            prefix = browse_id[:2]
+            if prefix == "UC":
+                artists.append({"name": sys.intern(text), "id": browse_id})
+            elif prefix == "MP" and browse_id[:5] == "MPREb":
+                album = {"name": sys.intern(text), "id": browse_id}
+        elif _is_view_count(text):
+            views = text
+
+    return title, video_id, artists, album, views, renderer
+
+
+_parse_song_fields = _parse_song_fields_counting
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import gettext
-import json
 import locale
 import time
 from collections.abc import Iterator
@@ -14,6 +13,7 @@ import requests
 from requests import Response
 from requests.structures import CaseInsensitiveDict
 
+from ytmusicapi._json import json_loads
 from ytmusicapi.helpers import (
     SUPPORTED_LANGUAGES,
     SUPPORTED_LOCATIONS,
@@ -237,7 +237,7 @@ class YTMusicBase:
             proxies=self.proxies,
             cookies=self.cookies,
         )
-        response_text: JsonDict = json.loads(response.text)
+        response_text: JsonDict = json_loads(response.content)
         if response.status_code >= 400:
             message = "Server returned HTTP " + str(response.status_code) + ": " + response.reason + ".\n"
             error = response_text.get("error", {}).get("message")